@@ -1,11 +1,16 @@
+from functools import lru_cache
 from typing import Dict
 from botplayers import agent_callable, InteractiveSpace, Agent
 
 
-def read_prompt(prompt_file, **args):
+@lru_cache()
+def _read_prompt_template(prompt_file):
     with open(prompt_file, 'r') as f:
-        content = f.read()
-        return content.format(**args)
+        return f.read()
+
+
+def read_prompt(prompt_file, **args):
+    return _read_prompt_template(prompt_file).format(**args)
 
 
 class ChatRoom(InteractiveSpace):
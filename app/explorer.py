@@ -5,6 +5,11 @@ from playwright.sync_api import sync_playwright
 from botplayers import Agent, InteractiveSpace, agent_callable
 from botplayers.util import print_in_color
 
+try:
+    from yaml import CSafeDumper as YamlSafeDumper
+except ImportError:
+    from yaml import SafeDumper as YamlSafeDumper
+
 TOKEN_ENCODING = tiktoken.encoding_for_model('gpt-3.5-turbo')
 
 
@@ -59,8 +64,8 @@ class Explorer(InteractiveSpace):
         self.page.goto(url)
         a11y_snapshot = self.page.accessibility.snapshot()
 
-        a11y_snapshot_txt = yaml.safe_dump(
-            a11y_snapshot, indent=2, allow_unicode=True)
+        a11y_snapshot_txt = yaml.dump(
+            a11y_snapshot, Dumper=YamlSafeDumper, indent=2, allow_unicode=True)
 
         self.last_result = a11y_snapshot_txt
         self.last_result_starting_idx = 0
@@ -81,8 +86,8 @@ class Explorer(InteractiveSpace):
         self.page.go_back()
         a11y_snapshot = self.page.accessibility.snapshot()
 
-        a11y_snapshot_txt = yaml.safe_dump(
-            a11y_snapshot, indent=2, allow_unicode=True)
+        a11y_snapshot_txt = yaml.dump(
+            a11y_snapshot, Dumper=YamlSafeDumper, indent=2, allow_unicode=True)
 
         self.last_result = a11y_snapshot_txt
         self.last_result_starting_idx = 0
@@ -1,8 +1,8 @@
 from botplayers import agent_callable, Agent, InteractiveSpace
 
 
-def to_markdown(list_data: list):
-    return '\n'.join([f'- {item}' for item in list_data])
+def to_markdown_item(item):
+    return f'- {item}'
 
 
 class Database(InteractiveSpace):
@@ -16,6 +16,8 @@ class Database(InteractiveSpace):
         'Alice likes David.'
     ]
 
+    num_confirms = 5
+
     @agent_callable
     def review_info(self, agent: Agent):
         """
@@ -23,30 +25,35 @@ class Database(InteractiveSpace):
         You can call this function multiple times to find more useful information.
         """
         useful_info = []
+        # Markdown of useful_info, extended as info is added instead of rebuilt for every prompt.
+        useful_info_md = ''
         for idx, info in enumerate(self.info_list):
-            if idx < len(self.info_list) - 1:
-                info_show_to_agent = f"[info from database]: {info}\n" + \
-                    "Is this info useful? Answer yes or no."
+            is_last = idx == len(self.info_list) - 1
+            if is_last:
+                is_useful = agent.classify_yes_no(
+                    {'role': 'user', 'content':
+                     f"[info from database]: {info}\n" +
+                     "There are no more info in the database. Is this info useful?"},
+                    n=self.num_confirms)
+                is_sufficient = False
             else:
-                info_show_to_agent = f"[info from database]: {info}\n" + \
-                    "There are no more info in the dabase."
-
-            response = agent.derive_avatar(interactive_objects=[]).receive_message(
-                {'role': 'user', 'content': info_show_to_agent}
-            ).think_and_act().last_message()
+                # Ask whether the info is useful and whether it would be sufficient in one request,
+                # the second answer only matters if the info is useful.
+                answers = agent.classify_yes_no_many(
+                    {'role': 'user', 'content':
+                     f"[info from database]: {info}\n" +
+                     'Current info if this info is useful:\n' + useful_info_md + to_markdown_item(info)},
+                    {'useful': 'Is this info useful?',
+                     'sufficient': 'Do you have sufficient infomation to answer the user\'s question '
+                                   'with the current info?'},
+                    n=self.num_confirms, only_if={'sufficient': 'useful'})
+                is_useful, is_sufficient = answers['useful'], answers['sufficient']
 
-            if response['content'].lower().startswith('y'):
+            if is_useful:
                 useful_info.append(info)
-
-                if idx < len(self.info_list) - 1:
-                    response = agent.derive_avatar(interactive_objects=[]).receive_message(
-                        {'role': 'user', 'content':
-                         'Current info:\n' + to_markdown(useful_info) + '\n' +
-                         'Do you have sufficient infomation to answer the user\'s question? Answer yes or no.'}
-                    ).think_and_act().last_message()
-                    
-                    if response['content'].lower().startswith('y'):
-                        break
+                useful_info_md += to_markdown_item(info) + '\n'
+                if is_sufficient:
+                    break
 
         return useful_info
 
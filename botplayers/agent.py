@@ -1,11 +1,22 @@
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 import inspect
-import re
+import httpx
 import json
-import openai
+import sys
+import time
+import uuid
+from collections import defaultdict
 from functools import lru_cache
+from openai import OpenAI
 
-from .util import print_in_color
+from .util import colorize_text_in_terminal, count_message_tokens, print_in_color, token_encoding
+
+try:
+    import orjson
+    _ORJSON_DUMPS_OPTION = (orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME |
+                            orjson.OPT_PASSTHROUGH_DATACLASS)
+except ImportError:
+    orjson = None
 
 SELF_PARAM_NAME = 'self'
 AGENT_PARAM_NAME = 'agent'
@@ -67,11 +78,11 @@ def _parse_agent_callable_function(function):
     if doc is None:
         doc = ''
     parameter_descriptions = {}
-    for name in parameters_clean:
-        pattern = rf'{name}:(.*)'
-        match = re.search(pattern, doc)
-        if match:
-            parameter_descriptions[name] = match.group(1).strip()
+    for line in doc.splitlines():
+        name, sep, description = line.partition(':')
+        name = name.strip()
+        if sep and name in parameters_clean and name not in parameter_descriptions:
+            parameter_descriptions[name] = description.strip()
 
     # Get function description from function doc string
     if 'Args:' in doc:
@@ -107,6 +118,26 @@ def _parse_agent_callable_function(function):
     return func_info
 
 
+def _json_dumps(obj: Any):
+    """
+    Serialize obj to a JSON string, with orjson if it is installed.
+    Datetimes and dataclasses are passed to str() either way.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=str, option=_ORJSON_DUMPS_OPTION).decode()
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, default=str)
+
+
+def _json_loads(s: str):
+    """ Deserialize a JSON string, with orjson if it is installed. """
+    if orjson is not None:
+        return orjson.loads(s)
+    return json.loads(s)
+
+
 def _parse_interactive_objects(interactive_objects: List[Any]):
     """ Install interactive objects. """
     function_info_table = {}
@@ -125,49 +156,195 @@ def _parse_interactive_objects(interactive_objects: List[Any]):
     return function_info_table
 
 
-def stream_chat_completion(engine: str, messages: List[dict], print_output: bool = True, **kwargs):
-    resp = openai.ChatCompletion.create(
+MAX_CONNECTIONS = 64
+
+
+@lru_cache()
+def _client():
+    """
+    The OpenAI client shared by all agents, created at first use.
+    Requests reuse its pooled HTTP/2 connections instead of opening a new one each time.
+    """
+    return OpenAI(http_client=httpx.Client(http2=True, limits=httpx.Limits(max_connections=MAX_CONNECTIONS)))
+
+
+PRINT_FLUSH_INTERVAL = 0.05
+
+
+def stream_chat_completion(engine: str, messages: List[dict], print_output: bool = True,
+                           print_every_n_chunks: Optional[int] = None, **kwargs):
+    resp = _client().chat.completions.create(
         model=engine,
         messages=messages,
         stream=True,
         **kwargs
     )
     role = ''
-    content = ''
-    function_call = dict()
+    content_parts = []
+    function_call_parts = defaultdict(list)
+
+    # Printed text is flushed every PRINT_FLUSH_INTERVAL seconds, or also every n chunks if given.
+    print_buffer = []
+    last_flush_time = time.monotonic()
+
+    def flush_print_buffer():
+        nonlocal last_flush_time
+        if print_buffer:
+            sys.stdout.write(colorize_text_in_terminal(
+                ''.join(print_buffer), 'yellow'))
+            sys.stdout.flush()
+            print_buffer.clear()
+        last_flush_time = time.monotonic()
+
     for chunk in resp:
-        for c in chunk['choices']:
-            delta = c['delta']
-            if 'role' in delta:
-                role = delta['role']
-
-            if 'function_call' in delta:
-                for key, val in delta['function_call'].items():
-                    if key not in function_call:
-                        function_call[key] = val
-                    else:
-                        function_call[key] += val
-
-            if 'content' in delta:
-                if len(content) == 0 and delta['content'] == '\n\n' or delta['content'] is None:
+        for c in chunk.choices:
+            delta = c.delta
+            if delta.role:
+                role = delta.role
+
+            if delta.function_call:
+                for key, val in delta.function_call.model_dump(exclude_none=True).items():
+                    function_call_parts[key].append(val)
+
+            if delta.content:
+                if not content_parts and delta.content == '\n\n':
                     continue
-                content += delta['content']
+                content_parts.append(delta.content)
                 if print_output:
-                    print_in_color(delta['content'], 'yellow', end='')
+                    print_buffer.append(delta.content)
+                    if time.monotonic() - last_flush_time >= PRINT_FLUSH_INTERVAL or \
+                            (print_every_n_chunks is not None and len(print_buffer) >= print_every_n_chunks):
+                        flush_print_buffer()
 
-    if len(content) > 0 and print_output:
+    flush_print_buffer()
+    if content_parts and print_output:
         print()
 
     message = dict()
     message['role'] = role
-    message['content'] = content
-    if len(function_call) > 0:
-        message['function_call'] = function_call
+    message['content'] = ''.join(content_parts)
+    if function_call_parts:
+        message['function_call'] = {
+            key: ''.join(parts) for key, parts in function_call_parts.items()}
     return message
 
 
+YES_NO_LOGIT_BIAS = 10
+
+
+@lru_cache()
+def _yes_no_logit_bias(engine: str):
+    """ Logit bias that pushes a one-token answer towards "Yes" or "No". """
+    encoding = token_encoding(engine)
+    return {token: YES_NO_LOGIT_BIAS for word in ('Yes', 'No') for token in encoding.encode(word)}
+
+
+def _is_yes(answer: Any):
+    """ Whether an answer of a yes/no question means yes. """
+    if isinstance(answer, str):
+        return answer.lower().startswith('y')
+    return answer is True
+
+
+def _votes_needed(yes_votes: int, no_votes: int, n: int):
+    """
+    The number of votes to ask for next, or 0 if the majority of n votes is already decided.
+    The first round asks for just a majority, which settles unanimous votes;
+    otherwise every remaining vote is asked for in a single follow-up round.
+    """
+    majority = n // 2 + 1
+    if yes_votes >= majority or no_votes >= majority:
+        return 0
+    if yes_votes + no_votes == 0:
+        return majority
+    return n - yes_votes - no_votes
+
+
+YES_NO_ANSWERS_FUNCTION_NAME = 'answer_yes_no_questions'
+YES_NO_ANSWER_KEY = 'answer'
+
+
+def _yes_no_answers_function(questions: Dict[str, str]):
+    """ A function signature whose arguments are the yes/no answers to the questions. """
+    return {
+        'name': YES_NO_ANSWERS_FUNCTION_NAME,
+        'description': 'Answer each of the questions with true (yes) or false (no).',
+        'parameters': {
+            'type': 'object',
+            'properties': {
+                key: {'type': 'boolean', 'description': question}
+                for key, question in questions.items()
+            },
+            'required': list(questions),
+        },
+    }
+
+
+def _tally_yes_no_content(messages: List[dict], yes_votes: Dict[str, int]):
+    """ Add the messages whose content means yes to yes_votes[YES_NO_ANSWER_KEY]. """
+    yes_votes[YES_NO_ANSWER_KEY] += sum(_is_yes(message['content']) for message in messages)
+
+
+def _tally_yes_no_answers(messages: List[dict], yes_votes: Dict[str, int]):
+    """ Add the yes votes in the function call arguments of each message to yes_votes. """
+    for message in messages:
+        function_call = message.get('function_call')
+        try:
+            answers = _json_loads(function_call['arguments'] if function_call else '{}')
+        except ValueError:
+            answers = {}
+        if not isinstance(answers, dict):
+            answers = {}
+        for key in yes_votes:
+            yes_votes[key] += _is_yes(answers.get(key))
+
+
+def _majority_vote(request, tally, keys: List[str], n: int,
+                   only_if: Optional[Dict[str, str]] = None):
+    """
+    Take the majority of n yes/no votes on each key, sampling the votes in rounds
+    that stop as soon as every majority is decided.
+
+    Args:
+        request: Called with a number of votes k, returns k response messages.
+        tally: Called with the response messages and the yes votes by key, adds the new yes votes.
+        keys (list): The keys of the questions to vote on.
+        n (int): The number of votes per question.
+        only_if (dict, optional): Maps a key to the key whose yes answer it depends on.
+            Once that answer is decided to be no, the key needs no more votes and is answered no.
+
+    Returns:
+        answers (dict): Whether the majority voted yes, keyed by key.
+    """
+    if only_if is None:
+        only_if = dict()
+    yes_votes = dict.fromkeys(keys, 0)
+    total_votes = 0
+
+    def is_moot(key):
+        condition = only_if.get(key)
+        return condition is not None and total_votes - yes_votes[condition] > n // 2
+
+    while True:
+        k = max((_votes_needed(votes, total_votes - votes, n)
+                 for key, votes in yes_votes.items() if not is_moot(key)), default=0)
+        if k == 0:
+            break
+        tally(request(k), yes_votes)
+        total_votes += k
+    return {key: votes > n // 2 and not is_moot(key) for key, votes in yes_votes.items()}
+
+
 DEFAULT_FUNCTION_CALL_REPEATS = 10
 DEFAULT_IGNORE_NONE_FUNCTION_MESSAGES = True
+DEFAULT_MAX_WINDOW_TOKENS = 8000
+
+# Memory is trimmed to this fraction of the window, so that the next few turns
+# fit without summarizing again.
+WINDOW_TRIM_RATIO = 0.75
+SUMMARY_MAX_TOKENS = 512
+SUMMARY_PROMPT = ('Summarize the conversation below in a short paragraph. '
+                  'Keep every fact, decision and open task that later turns may depend on.')
 
 
 class Agent:
@@ -180,6 +357,8 @@ class Agent:
         interactive_objects (list, optional): A list of interactive objects to install. Defaults to [].
         function_call_repeats (int, optional): The number of times to repeat function calls in agent.think_and_act().
         ignore_none_function_messages (bool, optional): Whether to ignore messages that does not involve function calling.
+        max_window_tokens (int, optional): The number of tokens to keep in memory.
+            Older messages are folded into a summary. Set to None to keep all messages. Defaults to 8000.
     """
     name: str = ''
     memory: List[dict] = []
@@ -187,33 +366,53 @@ class Agent:
     engine_args: dict = dict(temperature=1.0)
     interactive_objects: list = []
     callable_functions: dict = dict()
+    _function_descriptions: Optional[List[dict]] = None
     function_call_repeats: int = 1
     ignore_none_function_messages: bool = True
 
+    max_window_tokens: Optional[int] = DEFAULT_MAX_WINDOW_TOKENS
+    summary_message: Optional[dict] = None
+    _memory_tokens: int = 0
+    _num_counted_messages: int = 0
+
     derived_from: Optional['Agent'] = None
+    session_id: str = ''
 
     def __init__(self, name: str, prompt: Optional[str] = None,
                  engine: str = 'gpt-3.5-turbo-16k',
                  interactive_objects: list = [],
                  function_call_repeats: int = DEFAULT_FUNCTION_CALL_REPEATS,
                  ignore_none_function_messages: bool = DEFAULT_IGNORE_NONE_FUNCTION_MESSAGES,
+                 max_window_tokens: Optional[int] = DEFAULT_MAX_WINDOW_TOKENS,
                  derived_from: Optional['Agent'] = None):
         self.name = name
         self.engine = engine
 
+        # Each agent has its own memory list, never the shared class attribute.
+        self.memory = []
         if prompt is not None:
-            self.memory = [
-                {"role": "system",  "content": prompt},
-            ]
+            self.memory.append({"role": "system",  "content": prompt})
 
         self.interactive_objects = interactive_objects
         self.callable_functions = _parse_interactive_objects(
             interactive_objects)
+        self._function_descriptions = None
 
         self.function_call_repeats = function_call_repeats
         self.ignore_none_function_messages = ignore_none_function_messages
+        self.max_window_tokens = max_window_tokens
+        self.summary_message = None
+        self._memory_tokens = 0
+        self._num_counted_messages = 0
         self.derived_from = derived_from
 
+        # Avatars share the session id of their agent, so that requests sharing
+        # the same memory prefix are routed together and hit the prompt cache.
+        if derived_from is not None:
+            self.session_id = derived_from.session_id
+        else:
+            self.session_id = uuid.uuid4().hex
+
     def derive_avatar(self, interactive_objects: Optional[list] = None,
                       function_call_repeats: Optional[int] = None,
                       ignore_none_function_messages: Optional[bool] = None):
@@ -239,6 +438,7 @@ class Agent:
             interactive_objects=interactive_objects,
             function_call_repeats=function_call_repeats,
             ignore_none_function_messages=ignore_none_function_messages,
+            max_window_tokens=self.max_window_tokens,
             derived_from=self,
         )
 
@@ -248,11 +448,21 @@ class Agent:
             print_in_color(
                 f'    [{idx}] {message["role"]}: {message["content"]}', 'green')
 
+    def _iter_full_memory(self):
+        """ Iterate over the agent's full memory, from the oldest ancestor to itself. """
+        agents = []
+        agent = self
+        while agent is not None:
+            agents.append(agent)
+            agent = agent.derived_from
+        for agent in reversed(agents):
+            yield from agent.memory
+
     def full_memory(self):
         if self.derived_from is None:
             return self.memory
         else:
-            return self.derived_from.full_memory() + self.memory
+            return list(self._iter_full_memory())
 
     def print_full_memory(self):
         """ Print the agent's memory. """
@@ -265,16 +475,25 @@ class Agent:
         self.interactive_objects.append(interactive_object)
         self.callable_functions = _parse_interactive_objects(
             self.interactive_objects)
+        self.invalidate_function_cache()
+        return self
+
+    def invalidate_function_cache(self):
+        """
+        Drop the cached function descriptions.
+        Call this after changing agent.callable_functions directly.
+        """
+        self._function_descriptions = None
         return self
 
     def _callable_function_descriptions(self):
         """
         Get the descriptions of all GPT callable functions.
         """
-        ds = []
-        for _, function in self.callable_functions.items():
-            ds.append(function['sig'])
-        return ds
+        if self._function_descriptions is None:
+            self._function_descriptions = [
+                function['sig'] for function in self.callable_functions.values()]
+        return self._function_descriptions
 
     def _call_function(self, function_call: dict):
         """
@@ -297,7 +516,7 @@ class Agent:
             if function_args is None:
                 function_args = dict()
             else:
-                function_args: dict = json.loads(function_args)
+                function_args: dict = _json_loads(function_args)
 
             print_in_color(f'        with arguments {function_args}', 'blue')
             if has_agent_param:
@@ -326,52 +545,255 @@ class Agent:
         if print_output:
             print_in_color(
                 f'{self.name} received a message: {message["content"]}', 'green')
-        self.memory.append(message)
+        self._remember(message)
         return self
 
+    def _remember(self, message: dict):
+        """
+        Append a message to memory, keeping the running token count up to date.
+        """
+        self.memory.append(message)
+        if self.max_window_tokens is not None and \
+                self._num_counted_messages == len(self.memory) - 1:
+            self._memory_tokens += count_message_tokens(message, self.engine)
+            self._num_counted_messages += 1
+
+    def _memory_num_tokens(self):
+        """
+        The number of tokens in memory.
+        Messages are counted as they are remembered; the whole memory is only
+        recounted if it was changed some other way.
+        """
+        if self._num_counted_messages != len(self.memory):
+            self._memory_tokens = sum(
+                count_message_tokens(m, self.engine) for m in self.memory)
+            self._num_counted_messages = len(self.memory)
+        return self._memory_tokens
+
+    def _summarize(self, messages: List[dict]):
+        """
+        Summarize messages, together with the previous summary, in a single request.
+        """
+        lines = []
+        if self.summary_message is not None:
+            lines.append(f'summary of the earlier conversation: {self.summary_message["content"]}')
+        for message in messages:
+            content = message.get('content')
+            if message.get('function_call'):
+                content = f'calls function {message["function_call"]}'
+            lines.append(f'{message.get("name", message["role"])}: {content}')
+        resp = _client().chat.completions.create(
+            model=self.engine,
+            messages=[
+                {'role': 'system', 'content': SUMMARY_PROMPT},
+                {'role': 'user', 'content': '\n'.join(lines)},
+            ],
+            stream=False,
+            **dict(self.engine_args, max_tokens=SUMMARY_MAX_TOKENS, user=self.session_id)
+        )
+        return resp.choices[0].message.content or ''
+
+    def _ancestor_num_tokens(self):
+        """ The number of tokens in the memories of the agents this avatar is derived from. """
+        num_tokens = 0
+        agent = self.derived_from
+        while agent is not None:
+            num_tokens += agent._memory_num_tokens()
+            agent = agent.derived_from
+        return num_tokens
+
+    def _trim_memory(self):
+        """
+        Keep the memory within max_window_tokens.
+        The oldest messages after the leading system messages (the prompt and the summary)
+        are dropped and folded into the rolling summary message.
+        The memories of the agents an avatar is derived from count towards its window,
+        but only the avatar's own memory is trimmed.
+        """
+        if self.max_window_tokens is None:
+            return
+        ancestor_tokens = self._ancestor_num_tokens()
+        num_tokens = self._memory_num_tokens()
+        if ancestor_tokens + num_tokens <= self.max_window_tokens:
+            return
+
+        num_pinned = 0
+        while num_pinned < len(self.memory) and self.memory[num_pinned]['role'] == 'system':
+            num_pinned += 1
+
+        target_tokens = int(self.max_window_tokens * WINDOW_TRIM_RATIO) - ancestor_tokens
+        num_dropped = 0
+        # Always keep the latest message.
+        while num_tokens > target_tokens and num_pinned + num_dropped < len(self.memory) - 1:
+            start = num_pinned + num_dropped
+            # A function call is dropped together with its response, or not at all.
+            end = start + 1
+            if self.memory[start].get('function_call') and self.memory[end]['role'] == 'function':
+                end += 1
+            if end > len(self.memory) - 1:
+                break
+            for message in self.memory[start:end]:
+                num_tokens -= count_message_tokens(message, self.engine)
+            num_dropped = end - num_pinned
+
+        if not num_dropped:
+            return
+        # Memory is only changed once the summary succeeded, so a failed request loses nothing.
+        summary = self._summarize(
+            self.memory[num_pinned:num_pinned + num_dropped])
+        del self.memory[num_pinned:num_pinned + num_dropped]
+        self._memory_tokens = num_tokens
+        self._num_counted_messages = len(self.memory)
+
+        summary_message = {'role': 'system',
+                           'content': f'Summary of the earlier conversation: {summary}'}
+        for idx, message in enumerate(self.memory[:num_pinned]):
+            if message is self.summary_message:
+                self.memory[idx] = summary_message
+                self._memory_tokens -= count_message_tokens(message, self.engine)
+                break
+        else:
+            self.memory.insert(num_pinned, summary_message)
+            self._num_counted_messages += 1
+        self._memory_tokens += count_message_tokens(summary_message, self.engine)
+        self.summary_message = summary_message
+
     def think_and_act(self):
         """
         Think and act.
         """
+        call_kwargs = dict(
+            self.engine_args,
+            engine=self.engine,
+            print_output=not self.ignore_none_function_messages,
+            user=self.session_id,
+        )
+        callable_functions = None
+
         for _ in range(self.function_call_repeats):
+            # The cached descriptions are only rebuilt after the cache was invalidated,
+            # e.g. by a function call that added an interactive object.
+            function_descriptions = self._callable_function_descriptions()
+            if function_descriptions is not callable_functions:
+                callable_functions = function_descriptions
+                call_kwargs.pop('functions', None)
+                call_kwargs.pop('function_call', None)
+                if callable_functions:
+                    call_kwargs.update(functions=callable_functions, function_call="auto")
+
+            self._trim_memory()
             print_in_color(f'{self.name} >> ', 'yellow')
-            callable_functions = self._callable_function_descriptions()
-            if callable_functions:
-                new_message = stream_chat_completion(
-                    engine=self.engine,
-                    messages=self.full_memory(),
-                    print_output=not self.ignore_none_function_messages,
-                    functions=callable_functions,
-                    function_call="auto",
-                    **self.engine_args
-                )
-            else:
-                new_message = stream_chat_completion(
-                    engine=self.engine,
-                    messages=self.full_memory(),
-                    print_output=not self.ignore_none_function_messages,
-                    **self.engine_args
-                )
+            new_message = stream_chat_completion(
+                messages=self.full_memory(), **call_kwargs)
 
             if new_message.get("function_call"):
-                self.memory.append(new_message)
+                self._remember(new_message)
                 function_response = self._call_function(
                     new_message["function_call"])
                 if function_response is None:
                     function_response = 'done'
-                self.memory.append(
+                self._remember(
                     {
                         "role": "function",
                         "name": new_message["function_call"]["name"],
-                        "content": json.dumps(function_response, default=str),
+                        "content": _json_dumps(function_response),
                     }
                 )
             else:
                 if not self.ignore_none_function_messages:
-                    self.memory.append(new_message)
+                    self._remember(new_message)
                 break
         return self
 
+    def _response_to_messages_n(self, messages: List[dict], n: int, **kwargs):
+        """ Sample n responses to already assembled request messages in a single non-streamed request. """
+        resp = _client().chat.completions.create(
+            model=self.engine,
+            messages=messages,
+            n=n,
+            stream=False,
+            **{**self.engine_args, 'user': self.session_id, **kwargs}
+        )
+        new_messages = []
+        for c in resp.choices:
+            new_message = {'role': c.message.role, 'content': c.message.content or ''}
+            if c.message.function_call:
+                new_message['function_call'] = {
+                    'name': c.message.function_call.name,
+                    'arguments': c.message.function_call.arguments,
+                }
+            new_messages.append(new_message)
+        return new_messages
+
+    def response_to_message_n(self, message: dict, n: int, **kwargs):
+        """
+        Sample n responses to a message in a single request.
+        Neither the message nor the responses are recorded in the agent's memory,
+        and no functions are provided unless passed in kwargs, so this is meant for pure classification prompts.
+
+        Args:
+            message (dict): The message to respond to.
+            n (int): The number of responses to sample.
+            **kwargs: Extra arguments passed to the engine, overriding engine_args.
+
+        Returns:
+            messages (list): The n response messages.
+        """
+        return self._response_to_messages_n(
+            [*self._iter_full_memory(), message], n, **kwargs)
+
+    def classify_yes_no(self, message: dict, n: int = 1):
+        """
+        Answer a yes/no question with a single token, without streaming and without touching memory.
+        A vote of n is sampled in at most two requests: a majority first, which settles
+        unanimous votes (e.g. 3 of 5), then all of the remaining votes if it did not.
+        The request messages are built once and reused by both.
+
+        Args:
+            message (dict): The message that asks the question.
+            n (int, optional): The number of answers to take the majority of. Defaults to 1.
+
+        Returns:
+            answer (bool): Whether the answer is yes.
+        """
+        kwargs = dict(max_tokens=1, logit_bias=_yes_no_logit_bias(self.engine))
+        if n == 1:
+            kwargs['temperature'] = 0
+        messages = [*self._iter_full_memory(), message]
+        answers = _majority_vote(
+            lambda k: self._response_to_messages_n(messages, k, **kwargs),
+            _tally_yes_no_content, [YES_NO_ANSWER_KEY], n)
+        return answers[YES_NO_ANSWER_KEY]
+
+    def classify_yes_no_many(self, message: dict, questions: Dict[str, str], n: int = 1,
+                             only_if: Optional[Dict[str, str]] = None):
+        """
+        Answer several yes/no questions about a message in a single request, without touching memory.
+        The answers are returned through a forced function call.
+        Like agent.classify_yes_no(), the votes stop as soon as every majority is decided.
+
+        Args:
+            message (dict): The message that the questions are about.
+            questions (dict): The questions to answer, keyed by name.
+            n (int, optional): The number of answers to take the majority of. Defaults to 1.
+            only_if (dict, optional): Maps a question to the question it only matters for if answered yes,
+                e.g. {'sufficient': 'useful'}. It is answered no, without more votes, once the other is no.
+                Defaults to None.
+
+        Returns:
+            answers (dict): Whether the answer to each question is yes, keyed by name.
+        """
+        kwargs = dict(
+            functions=[_yes_no_answers_function(questions)],
+            function_call={'name': YES_NO_ANSWERS_FUNCTION_NAME},
+        )
+        if n == 1:
+            kwargs['temperature'] = 0
+        messages = [*self._iter_full_memory(), message]
+        return _majority_vote(
+            lambda k: self._response_to_messages_n(messages, k, **kwargs),
+            _tally_yes_no_answers, list(questions), n, only_if=only_if)
+
     def last_message(self):
         """
         Retreive the last message.
@@ -1,3 +1,10 @@
+from functools import lru_cache
+
+import tiktoken
+
+MESSAGE_TOKEN_OVERHEAD = 4
+
+
 def colorize_text_in_terminal(text: str, color: str):
     """Colorize text in terminal.
 
@@ -46,4 +53,37 @@ def print_in_color(text: str, color: str, end='\n'):
     print(colorize_text_in_terminal(text, color), end=end)
 
 
+@lru_cache()
+def token_encoding(engine: str):
+    """Get the tiktoken encoding of an engine.
 
+    Args:
+        engine: The GPT engine.
+
+    Returns:
+        encoding: The encoding, cl100k_base if the engine is unknown to tiktoken.
+    """
+    try:
+        return tiktoken.encoding_for_model(engine)
+    except KeyError:
+        return tiktoken.get_encoding('cl100k_base')
+
+
+def count_message_tokens(message: dict, engine: str):
+    """Count the tokens a chat message takes up in a request.
+
+    Args:
+        message: The chat message.
+        engine: The GPT engine.
+
+    Returns:
+        num_tokens: The number of tokens, including the per-message overhead.
+    """
+    encoding = token_encoding(engine)
+    num_tokens = MESSAGE_TOKEN_OVERHEAD
+    num_tokens += len(encoding.encode(message.get('content') or ''))
+    function_call = message.get('function_call')
+    if function_call:
+        num_tokens += len(encoding.encode(function_call.get('name') or ''))
+        num_tokens += len(encoding.encode(function_call.get('arguments') or ''))
+    return num_tokens